@@ -38,22 +38,109 @@ Example Usage:
         process_payment()
     except Exception as e:
         wd.pulse("payment_failure", status="error", message=f"Payment failed: {e}")
+
+    # On shutdown, flush pending pulses and stop the background threads
+    wd.close()
+
+    # Or scope the client with a with-block, which closes it on exit
+    with WatchDog(base_url="https://watchdog.example.com", project_token="your-token") as wd:
+        wd.pulse("db_health", status="ok")
+
+    # asyncio applications (requires aiohttp)
+    from client_example import AsyncWatchDog
+
+    async def main():
+        wd = AsyncWatchDog(base_url="https://watchdog.example.com", project_token="your-token")
+        wd.pulse("db_health", status="ok")
+        await wd.close()
 """
 
+from __future__ import annotations
+
+import functools
+import importlib
+import json
 import logging
+import queue
+import socket
 import threading
 import time
-from typing import List, Dict, Any, Literal, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Set
 
 try:
     import requests
 except ImportError:
     requests = None  # type: ignore
 
+# asyncio, aiohttp and httpx are imported on first use so that scripts which
+# only send a pulse with the sync client don't pay for them at startup
+if TYPE_CHECKING:
+    import asyncio
+    from types import ModuleType
+    from typing import Literal
+
+    import aiohttp
+    import httpx
+
+    StatusType = Literal["ok", "error"]
+else:
+    # Keeps runtime introspection (typing.get_type_hints) working
+    StatusType = str
+
+
+def _asyncio() -> ModuleType:
+    """Return the asyncio module, importing it on first use."""
+    return importlib.import_module("asyncio")
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
 
 logger = logging.getLogger(__name__)
 
-StatusType = Literal["ok", "error"]
+# Pulses arriving within this many seconds of each other share one request
+PULSE_BATCH_WINDOW = 0.05
+# Server-side limit for POST /api/pulse/batch (keeps it within D1 query limits)
+PULSE_BATCH_MAX_SIZE = 15
+# Pending pulses beyond this are dropped rather than buffered without bound
+PULSE_QUEUE_MAXSIZE = 1024
+
+# Fixed JSON fragments spliced around the per-pulse values (see WatchDog._skeleton)
+_STATUS_KEY = b',"status":'
+_MESSAGE_KEY = b',"message":'
+_LATENCY_KEY = b',"latency":'
+_STATUS_JSON = {"ok": b'"ok"', "error": b'"error"'}
+
+# Pulses are tiny and complete, so flush each one immediately (no Nagle delay)
+# and let the kernel detect dead keep-alive connections
+_SOCKET_OPTIONS = [
+    (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+]
+
+if requests is not None:
+    class _SocketOptionsAdapter(requests.adapters.HTTPAdapter):
+        """HTTPAdapter whose pooled connections are created with _SOCKET_OPTIONS."""
+
+        def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+            kwargs["socket_options"] = _SOCKET_OPTIONS
+            super().init_poolmanager(*args, **kwargs)
+
+if orjson is not None:
+    # orjson returns compact UTF-8 bytes for both whole payloads and bare strings
+    _dumps = orjson.dumps
+    _escape = orjson.dumps
+else:
+    def _dumps(obj: Any) -> bytes:
+        """Encode an object as compact JSON bytes."""
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+    def _escape(value: str) -> bytes:
+        """Encode a string as a quoted JSON string literal."""
+        return json.encoder.encode_basestring_ascii(value).encode("ascii")
 
 
 class WatchDog:
@@ -63,8 +150,9 @@ class WatchDog:
     This client sends heartbeats to the Watch-Dog Sentinel server.
     If heartbeats stop, the Sentinel will trigger an alert.
 
-    All network operations are fire-and-forget: they run in background
-    threads and never block or crash the main application.
+    All network operations are fire-and-forget: they run on background
+    threads and never block or crash the main application. Bursts of pulses
+    are coalesced into a single request to /api/pulse/batch.
     """
 
     def __init__(
@@ -73,6 +161,8 @@ class WatchDog:
         project_token: str,
         timeout: int = 5,
         silent: bool = True,
+        max_workers: int = 8,
+        http2: bool = False,
     ):
         """
         Initialize the Watch-Dog client.
@@ -83,17 +173,49 @@ class WatchDog:
             project_token: The bearer token for authentication
             timeout: HTTP request timeout in seconds (default: 5)
             silent: If True, suppress all logging from this client (default: True)
+            max_workers: Maximum number of background sender threads (default: 8)
+            http2: If True, send over one multiplexed HTTP/2 connection using
+                   httpx (requires `httpx[http2]`); falls back to requests
+                   if unavailable (default: False)
         """
         self.base_url = base_url.rstrip("/")
         self.token = project_token
         self.timeout = timeout
         self.silent = silent
+        self._pulse_url = self.base_url + "/api/pulse"
+        self._batch_url = self.base_url + "/api/pulse/batch"
+        self._config_url = self.base_url + "/api/config"
         self._headers = {
             "Authorization": f"Bearer {project_token}",
             "Content-Type": "application/json",
         }
-
-    def register(self, checks: List[Dict[str, Any]]) -> None:
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="watchdog"
+        )
+        self._client = self._build_http2_client() if http2 else None
+        self._session = self._build_session() if self._client is None else None
+        self._skeletons: Dict[str, bytes] = {}
+        self._closed = False
+        self._stop = threading.Event()
+        self._queue: queue.Queue[Optional[bytes]] = queue.Queue(
+            maxsize=PULSE_QUEUE_MAXSIZE
+        )
+        # Pre-bind the callables used on every pulse to skip repeated attribute lookups
+        self._request = self._bind_request()
+        self._put_pulse = self._queue.put_nowait
+        self._pool_submit = self._executor.submit
+        # Started on the first queued pulse, so clients that only register or
+        # send blocking pulses never keep a thread alive
+        self._drain_thread: Optional[threading.Thread] = None
+        self._drain_lock = threading.Lock()
+
+    def __enter__(self) -> WatchDog:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def register(self, checks: List[Dict[str, Any]], blocking: bool = False) -> None:
         """
         Register or update check definitions.
 
@@ -109,6 +231,8 @@ class WatchDog:
                 - grace (int, optional): Grace period in seconds before alert
                 - threshold (int, optional): Consecutive failures before alert
                 - cooldown (int, optional): Seconds to wait before re-alerting
+            blocking: If True, send on the calling thread and return once the
+                      server has answered (or the request failed)
 
         Example:
             wd.register([{
@@ -120,12 +244,25 @@ class WatchDog:
                 "threshold": 3
             }])
         """
-        payload = {"checks": checks}
+        if self._closed:
+            return
 
-        def _do_register():
-            self._send_request("PUT", "/api/config", payload)
+        try:
+            body = _dumps({"checks": checks})
+            for check in checks:
+                name = check.get("name")
+                if type(name) is str:
+                    self._skeleton(name)
+        except Exception as e:
+            # Unserializable check definitions - monitoring should never crash the main app
+            if not self.silent:
+                logger.warning(f"Watch-Dog register dropped: {e}")
+            return
 
-        threading.Thread(target=_do_register, daemon=True).start()
+        if blocking:
+            self._send_request("PUT", self._config_url, body)
+        else:
+            self._submit("PUT", self._config_url, body)
 
     def pulse(
         self,
@@ -133,54 +270,441 @@ class WatchDog:
         status: StatusType = "ok",
         message: str = "OK",
         latency: int = 0,
+        blocking: bool = False,
     ) -> None:
         """
         Send a heartbeat pulse for a check.
 
-        This is a fire-and-forget operation. The pulse is sent in a background
-        thread and any errors are silently swallowed to prevent impacting the
-        main application.
+        This is a fire-and-forget operation. The pulse is queued for a background
+        thread, which batches pulses sent in quick succession into one request.
+        If the queue is full the pulse is dropped, and any errors are silently
+        swallowed to prevent impacting the main application.
+
+        With blocking=True the pulse skips the queue and is sent directly on the
+        calling thread over the pooled connection. Use this from your own worker
+        threads or short-lived scripts: the call takes one server round trip
+        (up to `timeout` seconds), but no thread hand-off or batching delay is
+        involved. Errors are still swallowed.
 
         Args:
             check_name: The name of the check (must match registered name)
             status: Either "ok" or "error"
             message: Optional message describing the status
             latency: Latency in milliseconds (optional, for performance tracking)
+            blocking: If True, send on the calling thread instead of in the background
 
         Example:
             wd.pulse("db_connectivity", status="ok", latency=42)
             wd.pulse("db_connectivity", status="error", message="Connection timeout")
         """
+        if self._closed:
+            return
+
+        try:
+            # Coerce once so both encodings send the same status and message
+            status_text = status if type(status) is str else str(status)
+            message_text = message if type(message) is str else str(message)
+
+            head = self._skeletons.get(check_name)
+            if head is not None and type(latency) is int:
+                # Registered check: splice the volatile fields into the cached
+                # prefix instead of building and JSON-encoding a dict
+                body = (
+                    head
+                    + _STATUS_KEY
+                    + (_STATUS_JSON.get(status_text) or _escape(status_text))
+                    + _MESSAGE_KEY
+                    + _escape(message_text)
+                    + _LATENCY_KEY
+                    + b"%d}" % latency
+                )
+            else:
+                body = _dumps({
+                    "check_name": check_name,
+                    "status": status_text,
+                    "message": message_text,
+                    "latency": latency,
+                })
+        except Exception as e:
+            # Unserializable input - monitoring should never crash the main app
+            if not self.silent:
+                logger.warning(f"Watch-Dog pulse dropped: {e}")
+            return
+
+        if blocking:
+            self._send_request("POST", self._pulse_url, body)
+            return
+
+        if self._drain_thread is None:
+            self._start_drain_thread()
+
+        try:
+            self._put_pulse(body)
+        except queue.Full:
+            if not self.silent:
+                logger.warning(f"Watch-Dog pulse dropped: queue full ({check_name})")
+
+    def run_heartbeat(self, check_name: str, interval: float, func: Callable[[], Any]) -> None:
+        """
+        Run a health check on a fixed cadence until close() is called.
+
+        Calls func immediately and then every `interval` seconds, sending an
+        "ok" pulse with its latency or an "error" pulse if it raises. This
+        blocks the calling thread, so run it in a dedicated thread if needed.
+        Waiting uses threading.Event rather than time.sleep, so close()
+        ends the loop right away instead of after the current interval.
+
+        Args:
+            check_name: The name of the heartbeat check to pulse
+            interval: Seconds between calls to func
+            func: Zero-argument health check; raise to report an error
+
+        Example:
+            threading.Thread(
+                target=wd.run_heartbeat,
+                args=("db_connectivity", 60, lambda: db.execute("SELECT 1")),
+                daemon=True,
+            ).start()
+        """
+        while not self._stop.is_set():
+            start = time.perf_counter_ns()
+            try:
+                func()
+            except Exception as e:
+                self.pulse(check_name, status="error", message=str(e))
+            else:
+                latency = (time.perf_counter_ns() - start) // 1_000_000
+                self.pulse(check_name, status="ok", latency=latency)
+
+            self._stop.wait(interval)
+
+    def close(self) -> None:
+        """
+        Shut down the background workers.
+
+        Pulses and registrations already queued are still sent: close() waits
+        for the background threads to flush them (pulses for up to `timeout`
+        seconds) before closing the connection. Calls made after close() are
+        silently dropped. Any run_heartbeat() loops return.
+        """
+        self._closed = True
+        self._stop.set()
+        try:
+            # Wake the drain thread; if the queue is full it will notice
+            # _closed once the backlog is flushed
+            self._queue.put_nowait(None)
+        except queue.Full:
+            pass
+        # The drain thread is a daemon, so flush it here rather than lose
+        # queued pulses at interpreter exit
+        with self._drain_lock:
+            drain_thread = self._drain_thread
+        if drain_thread is not None:
+            drain_thread.join(timeout=self.timeout)
+        # An httpx Client refuses requests once closed, so only close the
+        # transport after pending registrations have gone out
+        self._executor.shutdown(wait=True)
+        if self._client is not None:
+            self._client.close()
+        if self._session is not None:
+            self._session.close()
+
+    def _build_http2_client(self) -> Optional[httpx.Client]:
+        """Create an HTTP/2 client that multiplexes all requests over one connection."""
+        try:
+            import httpx
+        except ImportError:
+            if not self.silent:
+                logger.warning("Watch-Dog: httpx library not installed, falling back to HTTP/1.1")
+            return None
+
+        try:
+            return httpx.Client(
+                http2=True,
+                limits=httpx.Limits(max_keepalive_connections=4),
+                headers=self._headers,
+                timeout=self.timeout,
+            )
+        except ImportError as e:
+            # httpx is installed without the h2 extra
+            if not self.silent:
+                logger.warning(f"Watch-Dog: HTTP/2 unavailable ({e}), falling back to HTTP/1.1")
+            return None
+
+    def _build_session(self) -> Optional[requests.Session]:
+        """Create a pooled keep-alive session shared by all requests."""
+        if requests is None:
+            return None
+
+        session = requests.Session()
+        adapter = _SocketOptionsAdapter(
+            pool_connections=4, pool_maxsize=16, max_retries=0
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.headers.update(self._headers)
+        return session
+
+    def _bind_request(self) -> Optional[Callable[[str, str, bytes], Any]]:
+        """Bind the transport's request call so the send path needs no branching."""
+        if self._client is not None:
+            # Timeout is configured on the httpx Client itself
+            client_request = self._client.request
+
+            def send_httpx(method: str, url: str, body: bytes) -> Any:
+                return client_request(method, url, content=body)
+
+            return send_httpx
+
+        if self._session is not None:
+            session_request = functools.partial(self._session.request, timeout=self.timeout)
+
+            def send_requests(method: str, url: str, body: bytes) -> Any:
+                return session_request(method, url, data=body)
+
+            return send_requests
+
+        return None
+
+    def _skeleton(self, check_name: str) -> bytes:
+        """Return the cached JSON prefix for a registered check's pulse body."""
+        head = self._skeletons.get(check_name)
+        if head is None:
+            head = b'{"check_name":' + _escape(check_name)
+            self._skeletons[check_name] = head
+        return head
+
+    def _start_drain_thread(self) -> None:
+        """Start the batching thread if no other caller has already done so."""
+        with self._drain_lock:
+            if self._drain_thread is None:
+                self._drain_thread = threading.Thread(
+                    target=self._drain_loop, name="watchdog-pulse", daemon=True
+                )
+                self._drain_thread.start()
+
+    def _drain_loop(self) -> None:
+        """Background loop that collects queued pulses and sends them in batches."""
+        get = self._queue.get
+        send = self._send_request
+        monotonic = time.monotonic
+
+        while True:
+            item = get()
+            if item is None:
+                return
+
+            batch = [item]
+            stop = False
+            deadline = monotonic() + PULSE_BATCH_WINDOW
+            while len(batch) < PULSE_BATCH_MAX_SIZE:
+                remaining = deadline - monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
+                    break
+                batch.append(item)
+
+            if len(batch) == 1:
+                send("POST", self._pulse_url, batch[0])
+            else:
+                send(
+                    "POST", self._batch_url, b'{"pulses":[' + b",".join(batch) + b"]}"
+                )
+
+            if stop or (self._closed and self._queue.empty()):
+                return
+
+    def _submit(self, method: str, url: str, body: bytes) -> None:
+        """Hand a request off to the worker pool without blocking the caller."""
+        try:
+            self._pool_submit(self._send_request, method, url, body)
+        except RuntimeError as e:
+            # Executor already shut down - monitoring should never crash the main app
+            if not self.silent:
+                logger.warning(f"Watch-Dog request dropped: {e}")
+
+    def _send_request(self, method: str, url: str, body: bytes) -> None:
+        """Internal method to send a pre-encoded JSON body in a background thread."""
+        if self._request is None:
+            if not self.silent:
+                logger.warning("Watch-Dog: requests library not installed, skipping request")
+            return
+
+        try:
+            # Content-Type: application/json is already set on the session
+            self._request(method, url, body)
+        except Exception as e:
+            # Silently fail - monitoring should never crash the main app
+            if not self.silent:
+                logger.warning(f"Watch-Dog request failed: {e}")
+
+
+class AsyncWatchDog:
+    """
+    Watch-Dog Sentinel Client for asyncio applications.
+
+    Same API as WatchDog, but requests are scheduled as tasks on the running
+    event loop over a shared aiohttp session instead of on worker threads.
+    pulse() and register() must be called from inside a running event loop;
+    calls made after close() are silently dropped.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        project_token: str,
+        timeout: int = 5,
+        silent: bool = True,
+    ):
+        """
+        Initialize the async Watch-Dog client.
+
+        Args:
+            base_url: The base URL of the Watch-Dog server
+                      (e.g., "https://watchdog.example.com")
+            project_token: The bearer token for authentication
+            timeout: HTTP request timeout in seconds (default: 5)
+            silent: If True, suppress all logging from this client (default: True)
+        """
+        self.base_url = base_url.rstrip("/")
+        self.token = project_token
+        self.timeout = timeout
+        self.silent = silent
+        self._pulse_url = self.base_url + "/api/pulse"
+        self._config_url = self.base_url + "/api/config"
+        self._headers = {
+            "Authorization": f"Bearer {project_token}",
+            "Content-Type": "application/json",
+        }
+        # aiohttp sessions must be created inside the event loop, so this is
+        # built lazily on the first request
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._tasks: Set[asyncio.Task[None]] = set()
+        self._stop = _asyncio().Event()
+
+    def register(self, checks: List[Dict[str, Any]]) -> None:
+        """
+        Register or update check definitions.
+
+        See WatchDog.register() for the check definition format.
+        """
+        self._schedule("PUT", self._config_url, {"checks": checks})
+
+    def pulse(
+        self,
+        check_name: str,
+        status: StatusType = "ok",
+        message: str = "OK",
+        latency: int = 0,
+    ) -> None:
+        """
+        Send a heartbeat pulse for a check.
+
+        The request runs as a background task; errors are silently swallowed.
+        See WatchDog.pulse() for argument details.
+        """
         payload = {
             "check_name": check_name,
             "status": status,
-            "message": str(message),
+            "message": message if type(message) is str else str(message),
             "latency": latency,
         }
+        self._schedule("POST", self._pulse_url, payload)
 
-        def _send_pulse():
-            self._send_request("POST", "/api/pulse", payload)
+    async def run_heartbeat(self, check_name: str, interval: float, func: Callable[[], Any]) -> None:
+        """
+        Run a health check on a fixed cadence until close() is called.
 
-        threading.Thread(target=_send_pulse, daemon=True).start()
+        Same behaviour as WatchDog.run_heartbeat(); func may be a plain
+        function or a coroutine function. The cadence waits on an
+        asyncio.Event, so close() or task cancellation ends the loop
+        immediately.
 
-    def _send_request(self, method: str, endpoint: str, payload: Dict[str, Any]) -> None:
-        """Internal method to send HTTP requests in a background thread."""
-        if requests is None:
+        Example:
+            asyncio.create_task(wd.run_heartbeat("db_connectivity", 60, check_db))
+        """
+        import inspect
+
+        asyncio = _asyncio()
+        while not self._stop.is_set():
+            start = time.perf_counter_ns()
+            try:
+                result = func()
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as e:
+                self.pulse(check_name, status="error", message=str(e))
+            else:
+                latency = (time.perf_counter_ns() - start) // 1_000_000
+                self.pulse(check_name, status="ok", latency=latency)
+
+            try:
+                await asyncio.wait_for(self._stop.wait(), timeout=interval)
+            except asyncio.TimeoutError:
+                pass
+
+    async def close(self) -> None:
+        """Stop heartbeat loops, wait for in-flight requests, then close the session."""
+        self._stop.set()
+        if self._tasks:
+            await _asyncio().gather(*self._tasks, return_exceptions=True)
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def _schedule(self, method: str, url: str, payload: Dict[str, Any]) -> None:
+        """Fire a request task on the running loop without awaiting it."""
+        if self._stop.is_set():
+            # Closed: a new task would reopen a session nothing closes
+            return
+
+        try:
+            loop = _asyncio().get_running_loop()
+        except RuntimeError as e:
+            # No running event loop - monitoring should never crash the main app
             if not self.silent:
-                logger.warning("Watch-Dog: requests library not installed, skipping request")
+                logger.warning(f"Watch-Dog request dropped: {e}")
             return
 
-        url = f"{self.base_url}{endpoint}"
+        task = loop.create_task(self._send_request(method, url, payload))
+        # Keep a strong reference until done so the task is not garbage collected
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def _get_session(self) -> Optional[aiohttp.ClientSession]:
+        """Return the shared session, creating it on first use (None without aiohttp)."""
+        if self._session is None:
+            try:
+                import aiohttp
+            except ImportError:
+                return None
+
+            self._session = aiohttp.ClientSession(
+                headers=self._headers,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                connector=aiohttp.TCPConnector(
+                    limit=16, ttl_dns_cache=300, keepalive_timeout=75
+                ),
+            )
+        return self._session
+
+    async def _send_request(self, method: str, url: str, payload: Dict[str, Any]) -> None:
+        """Internal coroutine to send HTTP requests on the event loop."""
+        session = self._get_session()
+        if session is None:
+            if not self.silent:
+                logger.warning("Watch-Dog: aiohttp library not installed, skipping request")
+            return
 
         try:
-            if method == "POST":
-                requests.post(
-                    url, json=payload, headers=self._headers, timeout=self.timeout
-                )
-            elif method == "PUT":
-                requests.put(
-                    url, json=payload, headers=self._headers, timeout=self.timeout
-                )
+            async with session.request(method, url, data=_dumps(payload)) as resp:
+                await resp.read()
         except Exception as e:
             # Silently fail - monitoring should never crash the main app
             if not self.silent:
@@ -215,18 +739,23 @@ def watchdog_pulse(
     """
 
     def decorator(func):
+        # Bind once per decoration so each call skips the attribute lookups
+        pulse = client.pulse
+        perf_counter_ns = time.perf_counter_ns
+
+        @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            start_time = time.time() if report_latency else None
+            start = perf_counter_ns() if report_latency else 0
             try:
                 result = func(*args, **kwargs)
-                if start_time is not None:
-                    latency = int((time.time() - start_time) * 1000)
-                    client.pulse(check_name, status="ok", latency=latency)
+                if report_latency:
+                    latency = (perf_counter_ns() - start) // 1_000_000
+                    pulse(check_name, status="ok", latency=latency)
                 else:
-                    client.pulse(check_name, status="ok")
+                    pulse(check_name, status="ok")
                 return result
             except Exception as e:
-                client.pulse(check_name, status="error", message=str(e))
+                pulse(check_name, status="error", message=str(e))
                 raise
 
         return wrapper
@@ -296,6 +825,17 @@ def example_heartbeat_monitoring():
     # Run the health check
     run_db_health_check()
 
+    # Alternatively, let the client drive the schedule. run_heartbeat() blocks
+    # until wd.close(), so give it its own thread:
+    #   threading.Thread(
+    #       target=wd.run_heartbeat,
+    #       args=("external_api_health", 30, check_external_api),
+    #       daemon=True,
+    #   ).start()
+
+    # Flush pending pulses and stop the background threads
+    wd.close()
+
 
 def example_event_monitoring():
     """
@@ -352,6 +892,9 @@ def example_event_monitoring():
     except Exception:
         print("Payment failed, alert sent to Watch-Dog")
 
+    # Flush pending pulses and stop the background threads
+    wd.close()
+
 
 def example_decorator_usage():
     """
@@ -385,6 +928,9 @@ def example_decorator_usage():
     result = cleanup_old_records()
     print(f"Function returned: {result}")
 
+    # Flush pending pulses and stop the background threads
+    wd.close()
+
 
 # =============================================================================
 # MAIN - Run examples when executed directly
@@ -5,8 +5,9 @@ import { Hono } from 'hono';
 import { cors } from 'hono/cors';
 import { html, raw } from 'hono/html';
 import type { ScheduledEvent } from '@cloudflare/workers-types';
-import { Env, Project, Check, PulsePayload, ConfigPayload, CheckConfig } from './types';
+import { Env, Project, Check, PulsePayload, BatchPulsePayload, ConfigPayload, CheckConfig } from './types';
 import { processCheckResult, findDeadChecks } from './services/logic';
+import { getSilencePeriod } from './services/alert';
 import { getAllSettings, updateSlackSettings, updateSetting } from './services/settings';
 
 // Type for Hono bindings
@@ -868,6 +869,135 @@ app.post('/api/pulse', async (c) => {
   }
 });
 
+/**
+ * POST /api/pulse/batch
+ * Receive several pulses from a service in one request
+ *
+ * Kept small so a full batch stays within the per-invocation D1 query limit
+ * (50 on Workers Free): 3 lookups up front, then 2 writes per pulse plus
+ * one settings read for each pulse that raises an alert (3 + 15 * 3 = 48).
+ */
+const MAX_PULSE_BATCH_SIZE = 15;
+
+app.post('/api/pulse/batch', async (c) => {
+  const db = c.env.DB;
+  const now = Math.floor(Date.now() / 1000);
+
+  // Support both Authorization: Bearer and legacy X-Project-Token
+  const authHeader = c.req.header('Authorization');
+  let token: string | undefined;
+
+  if (authHeader?.startsWith('Bearer ')) {
+    token = authHeader.slice(7);
+  } else {
+    // Fallback to legacy header for backward compatibility
+    token = c.req.header('X-Project-Token');
+  }
+
+  if (!token) {
+    return c.json({ error: 'Missing Authorization header (use: Authorization: Bearer {token})' }, 401);
+  }
+
+  let pulses: PulsePayload[];
+
+  try {
+    const body = await c.req.json<BatchPulsePayload>();
+    pulses = body.pulses;
+  } catch (error) {
+    console.error('Batch pulse error:', error);
+    return c.json({ error: 'Invalid request body' }, 400);
+  }
+
+  if (!pulses || !Array.isArray(pulses)) {
+    return c.json({ error: 'Missing or invalid pulses array' }, 400);
+  }
+
+  if (pulses.length > MAX_PULSE_BATCH_SIZE) {
+    return c.json({ error: `Too many pulses (max ${MAX_PULSE_BATCH_SIZE})` }, 400);
+  }
+
+  const results: Array<{ check_name: string; check_id?: string; status?: string; error?: string }> = [];
+
+  try {
+    const project = await db
+      .prepare('SELECT * FROM projects WHERE token = ?')
+      .bind(token)
+      .first<Project>();
+
+    if (!project) {
+      return c.json({ error: 'Invalid token' }, 403);
+    }
+
+    // Load settings and every referenced check once, not per pulse
+    const silencePeriod = await getSilencePeriod(db);
+    const checkNames = [...new Set(pulses.map((p) => p?.check_name).filter((n): n is string => !!n))];
+    const checks = new Map<string, Check>();
+
+    if (checkNames.length > 0) {
+      const { results: rows } = await db
+        .prepare(`SELECT * FROM checks WHERE project_id = ? AND name IN (${checkNames.map(() => '?').join(', ')})`)
+        .bind(project.id, ...checkNames)
+        .all<Check>();
+
+      for (const row of rows) {
+        checks.set(row.name, row);
+      }
+    }
+
+    // Process sequentially, carrying each check's updated state to its next pulse
+    for (const pulse of pulses) {
+      const { check_name, status = 'ok', message, latency } = pulse ?? ({} as PulsePayload);
+
+      if (!check_name) {
+        results.push({ check_name: '', error: 'Missing check_name' });
+        continue;
+      }
+
+      const check = checks.get(check_name);
+
+      if (!check) {
+        results.push({ check_name, error: 'Check not found. Register via /api/config first.' });
+        continue;
+      }
+
+      const newStatus: 'ok' | 'error' | 'dead' = status === 'error' ? 'error' : 'ok';
+      const pulseMessage = message || (status === 'error' ? 'Service reported error' : 'Pulse received');
+
+      const updated = await processCheckResult(
+        db,
+        c.env,
+        check,
+        project,
+        newStatus,
+        pulseMessage,
+        latency ?? 0,
+        silencePeriod
+      );
+      checks.set(check_name, updated);
+
+      results.push({ check_name, check_id: check.id, status: newStatus });
+    }
+  } catch (error) {
+    // Earlier pulses may already be applied; report exactly which ones
+    console.error('Batch pulse error:', error);
+    const processed = results.filter((r) => !r.error).length;
+    return c.json({
+      success: false,
+      error: 'Batch processing failed',
+      processed,
+      results,
+      timestamp: now,
+    }, 500);
+  }
+
+  return c.json({
+    success: true,
+    processed: results.filter((r) => !r.error).length,
+    results,
+    timestamp: now,
+  });
+});
+
 /**
  * POST /api/maintenance/:projectId
  * Toggle maintenance mode for a project
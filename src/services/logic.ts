@@ -5,6 +5,13 @@ import { D1Database } from '@cloudflare/workers-types';
 import { Env, Check, Project } from '../types';
 import { sendSlackAlert, isInSilencePeriod, getSilencePeriod } from './alert';
 
+/**
+ * Apply a pulse or dead-check result to a check and alert if needed.
+ *
+ * Pass `silencePeriod` when processing many results in one request so the
+ * settings table is read once instead of per result. Returns the check with
+ * its updated state, for callers that process further results for it.
+ */
 export async function processCheckResult(
   db: D1Database,
   env: Env,
@@ -12,10 +19,11 @@ export async function processCheckResult(
   project: Project,
   newStatus: 'ok' | 'error' | 'dead',
   message: string,
-  latency: number = 0
-): Promise<void> {
+  latency: number = 0,
+  silencePeriod?: number
+): Promise<Check> {
   const now = Math.floor(Date.now() / 1000);
-  const silencePeriod = await getSilencePeriod(db);
+  silencePeriod ??= await getSilencePeriod(db);
 
   let failureCount = check.failure_count;
   let lastAlertAt = check.last_alert_at;
@@ -51,30 +59,28 @@ export async function processCheckResult(
     }
   }
 
-  // 2. Update database
-  await db
-    .prepare(
-      `UPDATE checks SET
-        status = ?,
-        last_seen = ?,
-        failure_count = ?,
-        last_alert_at = ?,
-        last_message = ?
-      WHERE id = ?`
-    )
-    .bind(newStatus, now, failureCount, lastAlertAt, message, check.id)
-    .run();
-
-  // 3. Write log
-  await db
-    .prepare(
-      `INSERT INTO logs (check_id, status, latency, message, created_at)
-      VALUES (?, ?, ?, ?, ?)`
-    )
-    .bind(check.id, newStatus, latency, message, now)
-    .run();
+  // 2. Update check state and write log in one round trip
+  await db.batch([
+    db
+      .prepare(
+        `UPDATE checks SET
+          status = ?,
+          last_seen = ?,
+          failure_count = ?,
+          last_alert_at = ?,
+          last_message = ?
+        WHERE id = ?`
+      )
+      .bind(newStatus, now, failureCount, lastAlertAt, message, check.id),
+    db
+      .prepare(
+        `INSERT INTO logs (check_id, status, latency, message, created_at)
+        VALUES (?, ?, ?, ?, ?)`
+      )
+      .bind(check.id, newStatus, latency, message, now),
+  ]);
 
-  // 4. Send notification
+  // 3. Send notification
   if (shouldAlert) {
     const title = newStatus === 'dead'
       ? 'Service DEAD'
@@ -97,6 +103,15 @@ export async function processCheckResult(
       },
     });
   }
+
+  return {
+    ...check,
+    status: newStatus,
+    last_seen: now,
+    failure_count: failureCount,
+    last_alert_at: lastAlertAt,
+    last_message: message,
+  };
 }
 
 export async function findDeadChecks(
@@ -7,7 +7,7 @@
  * - Project: Project entity with maintenance state
  * - Check: Check entity with monitoring rules and current state
  * - Log: Historical log entries
- * - PulsePayload, ConfigPayload, CheckConfig: API request types
+ * - PulsePayload, BatchPulsePayload, ConfigPayload, CheckConfig: API request types
  *
  * @module types
  */
@@ -127,6 +127,16 @@ export interface PulsePayload {
   latency?: number;
 }
 
+/**
+ * Payload for POST /api/pulse/batch endpoint
+ *
+ * Clients coalesce bursts of pulses into one request, processed in order.
+ */
+export interface BatchPulsePayload {
+  /** Pulses to process, in the order they were emitted */
+  pulses: PulsePayload[];
+}
+
 /**
  * Configuration for a single check
  *